@@ -1,11 +1,18 @@
+import asyncio
+import importlib.util
 import logging
+import os
+import re
+import tempfile
 import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 
 import httpx
-import json
 from pathlib import Path
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel
+from typing import IO, AsyncIterator, Awaitable, Callable, Iterator, List, Optional, Dict, Any, Tuple, TypeVar
+from pydantic import TypeAdapter
+from pydantic_core import from_json, to_json
 from docling_serve.datamodel.responses import (
     HealthCheckResponse,
     TaskStatusResponse
@@ -13,65 +20,241 @@ from docling_serve.datamodel.responses import (
 
 logger = logging.getLogger(__name__)
 
-WAITING_TIME = 2
+T = TypeVar("T")
+
+# Seconds the server holds a status poll open waiting for completion; the
+# client read timeout must exceed it so the server always answers first.
+LONG_POLL_WAIT = 30.0
+LONG_POLL_TIMEOUT = httpx.Timeout(LONG_POLL_WAIT + 5.0, connect=5.0)
+# Servers that support it return the result with the final status, saving the
+# follow-up GET /v1/result; others ignore the unknown query parameter.
+POLL_PARAMS = {"wait": LONG_POLL_WAIT, "include_result": "true"}
+# Fallback backoff when `wait` is ignored: 0.1s, 0.2s, 0.4s, ... capped at 5s,
+# so short tasks are noticed quickly and long ones are not polled needlessly.
+MIN_POLL_BACKOFF = 0.1
+MAX_POLL_BACKOFF = 5.0
+
+# Keep idle connections around as long as typical reverse proxies do (nginx
+# defaults to 75s), so polls reuse the TCP/TLS connection.
+CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=75.0)
+# HTTP/2 needs the optional `h2` package (`pip install httpx[http2]`).
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Upload read size: small chunks collapse throughput, 1 MiB keeps the socket busy.
+UPLOAD_CHUNK_SIZE = 1 << 20
+MAX_OPEN_WORKERS = 32
+RESULT_CHUNK_SIZE = 1 << 20
+MAX_ERROR_BODY = 4096
 
 API_URL = "http://localhost:5001"
 PROCESS_URL_ENDPOINT = "/v1/convert/source/async"
 PROCESS_FILE_ENDPOINT = "/v1/convert/file/async"
 
 
+class TaskStatusWithResult(TaskStatusResponse):
+    """Status poll response, plus the result when the server inlines it."""
+
+    result: Optional[Dict[str, Any]] = None
+
+
+# Built once at import and reused by every poll
+_TASK_STATUS_ADAPTER = TypeAdapter(TaskStatusWithResult)
+_HEALTH_ADAPTER = TypeAdapter(HealthCheckResponse)
+
+
+# Same escaping httpx applies to multipart name/filename parameters, so that
+# quotes, backslashes or CR/LF in a file name cannot break out of the header.
+_FORM_PARAM_ESCAPES = {'"': "%22", "\\": "\\\\"}
+_FORM_PARAM_ESCAPES.update({chr(c): f"%{c:02X}" for c in range(0x20) if c != 0x1B})
+_FORM_PARAM_RE = re.compile("|".join(re.escape(c) for c in _FORM_PARAM_ESCAPES))
+
+
+def _format_form_param(name: str, value: str) -> str:
+    return f'{name}="{_FORM_PARAM_RE.sub(lambda m: _FORM_PARAM_ESCAPES[m.group(0)], value)}"'
+
+
+def _open_upload_file(file_path: Path | str) -> Tuple[str, IO[bytes]]:
+    # os.path instead of Path(): this runs once per file of a possibly huge batch
+    if not os.path.isfile(file_path):
+        raise FileNotFoundError(f"File not found: {file_path}")
+    # Buffer reads to match the upload chunk size
+    return os.path.basename(file_path), open(file_path, "rb", buffering=UPLOAD_CHUNK_SIZE)
+
+
+class MultipartUpload:
+    """multipart/form-data body streamed from disk in UPLOAD_CHUNK_SIZE chunks.
+
+    Only one chunk per file is held in memory at a time, and the first bytes hit
+    the network before the files have been read completely.
+    """
+
+    def __init__(
+            self,
+            files: List[Tuple[str, IO[bytes], str]],
+            data: Optional[Dict[str, str]] = None,
+            chunk_size: int = UPLOAD_CHUNK_SIZE
+    ):
+        self.files = files
+        self.data = data or {}
+        self.chunk_size = chunk_size
+        self.boundary = os.urandom(16).hex()
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        # An explicit length lets httpx skip chunked transfer-encoding.
+        return {"Content-Type": self.content_type, "Content-Length": str(self.content_length)}
+
+    @property
+    def content_length(self) -> int:
+        length = len(self._closing_boundary())
+        for name, value in self.data.items():
+            length += len(self._part_header(name)) + len(value.encode()) + 2
+        for filename, file_handle, content_type in self.files:
+            remaining = os.fstat(file_handle.fileno()).st_size - file_handle.tell()
+            length += len(self._part_header("files", filename, content_type)) + remaining + 2
+        return length
+
+    def _closing_boundary(self) -> bytes:
+        return f"--{self.boundary}--\r\n".encode()
+
+    def _part_header(self, name: str, filename: Optional[str] = None, content_type: Optional[str] = None) -> bytes:
+        disposition = f"form-data; {_format_form_param('name', name)}"
+        if filename:
+            disposition += f"; {_format_form_param('filename', filename)}"
+        header = f"--{self.boundary}\r\nContent-Disposition: {disposition}\r\n"
+        if content_type is not None:
+            header += f"Content-Type: {content_type}\r\n"
+        return (header + "\r\n").encode()
+
+    def __iter__(self) -> Iterator[bytes]:
+        for name, value in self.data.items():
+            yield self._part_header(name) + value.encode() + b"\r\n"
+        for filename, file_handle, content_type in self.files:
+            yield self._part_header("files", filename, content_type)
+            while chunk := file_handle.read(self.chunk_size):
+                yield chunk
+            yield b"\r\n"
+        yield self._closing_boundary()
+
+    async def aiter_bytes(self) -> AsyncIterator[bytes]:
+        """Async body: disk reads run in a worker thread, off the event loop."""
+        for name, value in self.data.items():
+            yield self._part_header(name) + value.encode() + b"\r\n"
+        for filename, file_handle, content_type in self.files:
+            yield self._part_header("files", filename, content_type)
+            while chunk := await asyncio.to_thread(file_handle.read, self.chunk_size):
+                yield chunk
+            yield b"\r\n"
+        yield self._closing_boundary()
+
+
 class DoclingServeClient:
     def __init__(
             self,
             base_url: str = API_URL,
             api_key: Optional[str] = None,
-            timeout: float = 120.0
+            timeout: float = 120.0,
+            http2_prior_knowledge: bool = False
     ):
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
-        self.client = httpx.Client(timeout=timeout, limits=httpx.Limits(max_keepalive_connections=5))
+        # Over https, HTTP/2 is negotiated via ALPN and falls back to HTTP/1.1 by
+        # itself. Plain-text HTTP/2 (h2c) has no negotiation, so it is opt-in for
+        # servers known to speak it (e.g. hypercorn); uvicorn only serves HTTP/1.1.
+        if http2_prior_knowledge and not HTTP2_AVAILABLE:
+            raise ImportError("HTTP/2 requires the h2 package: pip install 'httpx[http2]'")
+        client_options: Dict[str, Any] = {
+            "timeout": timeout,
+            "limits": CLIENT_LIMITS,
+            "headers": {"Authorization": f"Bearer {api_key}"} if api_key else None,
+            "http1": not http2_prior_knowledge,
+            "http2": HTTP2_AVAILABLE,
+        }
+        self._client_options = client_options
+        self.client = httpx.Client(**client_options)
 
     def close(self):
         self.client.close()
 
+    def async_client(self) -> httpx.AsyncClient:
+        """New AsyncClient with the same settings, for the a-prefixed methods.
+
+        Its pooled connections are bound to the event loop that opens them, so
+        open it inside the coroutine that uses it:
+        `async with client.async_client() as aclient: ...`
+        """
+        return httpx.AsyncClient(**self._client_options)
+
     def health(self) -> HealthCheckResponse:
         """GET /health"""
         resp = self._request("GET", "/health")
-        return HealthCheckResponse.model_validate(resp.json())
-
-
-
-
+        return _HEALTH_ADAPTER.validate_json(resp.content)
 
     def convert_source_sync(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """POST /v1/convert/source (synchronous)"""
         resp = self._request("POST", "/v1/convert/source", json=request)
-        return resp.json()
-
-    def wait_for_success(self, task_id: str):
-        status_is_done = False
-        while status_is_done != True:
-            time.sleep(WAITING_TIME)
-            logger.debug("Task %s not done yet, sleeping %s seconds", task_id, WAITING_TIME)
-            resp_task_status_obj = self._request("GET", f"/v1/status/poll/{task_id}", timeout=WAITING_TIME).json()
-            if resp_task_status_obj["task_status"] == "success":
-                status_is_done = True
-        # self._request("GET", f"/v1/result/{task_obj_id}", timeout=WAITING_TIME)
-        return status_is_done
+        return from_json(resp.content)
 
-    def process_file_async(self, files: List[Path | str], options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """POST /v1/convert/file (multipart file upload)"""
-        files_data = []
-        file_handles = []  # Track handles to close them later
+    def wait_for_success(self, task_id: str) -> bool:
+        """Long-poll GET /v1/status/poll/{task_id} until the task completes.
 
-        for file_path in files:
-            file_path = Path(file_path)
-            if not file_path.exists():
-                raise FileNotFoundError(f"File not found: {file_path}")
+        Returns True on success and False on failure.
+        """
+        return self._wait_for_completion(task_id).task_status == "success"
 
-            file_handle = open(file_path, "rb")
+    def _wait_for_completion(self, task_id: str) -> TaskStatusWithResult:
+        # Built once: the loop may run many times for a long conversion.
+        poll_url = self._url(f"/v1/status/poll/{task_id}")
+        delay = 0.0
+        while True:
+            started = time.monotonic()
+            try:
+                resp = self.client.get(poll_url, params=POLL_PARAMS, timeout=LONG_POLL_TIMEOUT)
+                task = _TASK_STATUS_ADAPTER.validate_json(self._check_response(resp).content)
+            except httpx.ReadTimeout:
+                logger.debug("Long poll for task %s timed out, reconnecting", task_id)
+                continue
+
+            if task.task_status in ("success", "failure"):
+                return task
+
+            # The server answered before the wait expired without a final status,
+            # so it does not honour `wait`: back off instead of hammering it.
+            if time.monotonic() - started < LONG_POLL_WAIT / 2:
+                delay = min(MAX_POLL_BACKOFF, max(MIN_POLL_BACKOFF, delay * 2))
+                logger.debug("Task %s not done yet, sleeping %s seconds", task_id, delay)
+                time.sleep(delay)
+
+    def _prepare_upload(
+            self,
+            files: List[Path | str],
+            options: Optional[Dict[str, Any]] = None
+    ) -> Tuple[MultipartUpload, List[IO[bytes]]]:
+        """Open the files and build the streamed multipart body for the file endpoint."""
+        # Overlap the stat()/open() calls of large batches, which matters on
+        # networked filesystems with a cold cache.
+        with ThreadPoolExecutor(max_workers=max(1, min(MAX_OPEN_WORKERS, len(files)))) as pool:
+            futures = [pool.submit(_open_upload_file, file_path) for file_path in files]
+
+        files_data = []
+        file_handles = []  # Track handles to close them later
+        error: Optional[BaseException] = None
+        for future in futures:
+            if future.exception() is not None:
+                error = error or future.exception()
+                continue
+            name, file_handle = future.result()
             file_handles.append(file_handle)
-            files_data.append(("files", (file_path.name, file_handle, "application/pdf")))
+            files_data.append((name, file_handle, "application/pdf"))
+
+        if error is not None:
+            for file_handle in file_handles:
+                file_handle.close()
+            raise error
 
         # **FIX**: Serialize options dict to JSON string for multipart form
         data: Dict[str, str] = {}
@@ -83,66 +266,247 @@ class DoclingServeClient:
         #
 
         if options:
-            data["options"] = json.dumps(options)
+            data["options"] = to_json(options).decode()
+
+        return MultipartUpload(files_data, data), file_handles
+
+    def submit_files(self, files: List[Path | str], options: Optional[Dict[str, Any]] = None) -> str:
+        """POST /v1/convert/file/async, returning the task id without waiting.
+
+        All files go in one multipart request and are converted as a single task.
+        """
+        upload, file_handles = self._prepare_upload(files, options)
 
-        #Call to the endpoint "/v1/convert/file"
+        #Call to the endpoint "/v1/convert/file/async"
         try:
-            resp = self._request("POST", PROCESS_FILE_ENDPOINT, files=files_data, data=data)
-            task_obj = resp.json()
-            task_obj_id = task_obj["task_id"]
-            if self.wait_for_success(task_obj_id):
-                result_obj = self.get_parsed_result(task_obj_id)
-            #result_obj = self._request("GET", f"/v1/result/{task_obj_id}", timeout=WAITING_TIME)
-            return result_obj.json()
+            resp = self._request(
+                "POST", PROCESS_FILE_ENDPOINT,
+                content=upload, headers=upload.headers
+            )
+            return TaskStatusResponse.model_validate_json(resp.content).task_id
         finally:
                 # Always close file handles
             for file_handle in file_handles:
                 file_handle.close()
 
+    def process_file_async(self, files: List[Path | str], options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """POST /v1/convert/file (multipart file upload)"""
+        task_obj_id = self.submit_files(files, options)
+        task = self._wait_for_completion(task_obj_id)
+        if task.task_status != "success":
+            raise Exception(f"Task {task_obj_id} failed")
+        if task.result is not None:
+            return task.result
+        return self.get_parsed_result(task_obj_id)
+
+    async def atask_status(
+            self,
+            aclient: httpx.AsyncClient,
+            task_id: str,
+            wait: float = 0.0
+    ) -> TaskStatusResponse:
+        """GET /v1/status/poll/{task_id} (async)"""
+        params = {"wait": wait}
+        resp = await self._arequest(aclient, "GET", f"/v1/status/poll/{task_id}", params=params)
+        return TaskStatusResponse.model_validate_json(resp.content)
+
+    async def await_for_success(self, aclient: httpx.AsyncClient, task_id: str) -> bool:
+        """Async variant of wait_for_success."""
+        return (await self._await_for_completion(aclient, task_id)).task_status == "success"
+
+    async def _await_for_completion(self, aclient: httpx.AsyncClient, task_id: str) -> TaskStatusWithResult:
+        poll_url = self._url(f"/v1/status/poll/{task_id}")
+        delay = 0.0
+        while True:
+            started = time.monotonic()
+            try:
+                resp = await aclient.get(poll_url, params=POLL_PARAMS, timeout=LONG_POLL_TIMEOUT)
+                task = _TASK_STATUS_ADAPTER.validate_json(self._check_response(resp).content)
+            except httpx.ReadTimeout:
+                logger.debug("Long poll for task %s timed out, reconnecting", task_id)
+                continue
+
+            if task.task_status in ("success", "failure"):
+                return task
+
+            if time.monotonic() - started < LONG_POLL_WAIT / 2:
+                delay = min(MAX_POLL_BACKOFF, max(MIN_POLL_BACKOFF, delay * 2))
+                logger.debug("Task %s not done yet, sleeping %s seconds", task_id, delay)
+                await asyncio.sleep(delay)
+
+    async def aprocess_file_async(
+            self,
+            aclient: httpx.AsyncClient,
+            files: List[Path | str],
+            options: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Async variant of process_file_async, so many uploads can run concurrently."""
+        # Opening the batch joins a thread pool: keep that wait off the event loop
+        upload, file_handles = await asyncio.to_thread(self._prepare_upload, files, options)
+
+        try:
+            resp = await self._arequest(
+                aclient, "POST", PROCESS_FILE_ENDPOINT,
+                content=upload.aiter_bytes(), headers=upload.headers
+            )
+            task_obj_id = TaskStatusResponse.model_validate_json(resp.content).task_id
+        finally:
+            for file_handle in file_handles:
+                file_handle.close()
+
+        return await self.aget_task_result(aclient, task_obj_id)
+
+    async def aget_task_result(self, aclient: httpx.AsyncClient, task_id: str) -> Dict[str, Any]:
+        """Wait for a submitted task and return its parsed result (async)."""
+        task = await self._await_for_completion(aclient, task_id)
+        if task.task_status != "success":
+            raise Exception(f"Task {task_id} failed")
+        if task.result is not None:
+            return task.result
+        return await self.aget_parsed_result(aclient, task_id)
+
     def task_status(self, task_id: str, wait: float = 0.0) -> TaskStatusResponse:
         """GET /v1/status/poll/{task_id}"""
         params = {"wait": wait}
         resp = self._request("GET", f"/v1/status/poll/{task_id}", params=params)
-        return TaskStatusResponse.model_validate(resp.json())
+        return TaskStatusResponse.model_validate_json(resp.content)
 
     def get_parsed_result(self, task_id: str) -> Dict[str, Any]:
-        """GET /v1/result/{task_id}"""
-        resp = self._request("GET", f"/v1/result/{task_id}")
-        return resp
+        """GET /v1/result/{task_id}
+
+        The body is streamed into one buffer rather than collected as chunks and
+        joined, so large results do not briefly sit in memory twice.
+        """
+        buf = bytearray()
+        with self.client.stream("GET", self._url(f"/v1/result/{task_id}")) as resp:
+            self._check_stream(resp)
+            for chunk in resp.iter_bytes(chunk_size=RESULT_CHUNK_SIZE):
+                buf += chunk
+        return from_json(buf)
+
+    async def aget_parsed_result(self, aclient: httpx.AsyncClient, task_id: str) -> Dict[str, Any]:
+        """GET /v1/result/{task_id} (async)"""
+        buf = bytearray()
+        async with aclient.stream("GET", self._url(f"/v1/result/{task_id}")) as resp:
+            await self._acheck_stream(resp)
+            async for chunk in resp.aiter_bytes(chunk_size=RESULT_CHUNK_SIZE):
+                buf += chunk
+        return from_json(buf)
+
+    def download_result(self, task_id: str, target: Path | str) -> Path:
+        """GET /v1/result/{task_id} written straight to disk, e.g. for zip results."""
+        target = Path(target)
+        with self.client.stream("GET", self._url(f"/v1/result/{task_id}")) as resp:
+            self._check_stream(resp)
+            with open(target, "wb") as f:
+                for chunk in resp.iter_bytes(chunk_size=RESULT_CHUNK_SIZE):
+                    f.write(chunk)
+        return target
 
     def clear_converters(self):
         """GET /v1/clear/converters"""
         resp = self._request("GET", "/v1/clear/converters")
-        return resp.json()
+        return from_json(resp.content)
 
-    def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
-        url = f"{self.base_url}{path}"
+    def _url(self, path: str) -> str:
+        return self.base_url + path
 
-        if self.api_key:
-            kwargs["headers"] = kwargs.get("headers", {})
-            kwargs["headers"]["Authorization"] = f"Bearer {self.api_key}"
+    def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        url = self._url(path)
+        self._encode_json(kwargs)
 
         resp = self.client.request(method, url, **kwargs)
+        return self._check_response(resp)
+
+    async def _arequest(self, aclient: httpx.AsyncClient, method: str, path: str, **kwargs) -> httpx.Response:
+        url = self._url(path)
+        self._encode_json(kwargs)
+
+        resp = await aclient.request(method, url, **kwargs)
+        return self._check_response(resp)
+
+    @staticmethod
+    def _encode_json(kwargs: Dict[str, Any]) -> None:
+        """Serialize a `json=` payload with pydantic-core rather than the stdlib encoder."""
+        if "json" in kwargs:
+            kwargs["content"] = to_json(kwargs.pop("json"))
+            kwargs["headers"] = {**kwargs.get("headers", {}), "Content-Type": "application/json"}
+
+    @classmethod
+    def _check_stream(cls, resp: httpx.Response) -> httpx.Response:
+        """_check_response for streamed responses, whose error body must be read first."""
+        if resp.status_code >= 400:
+            resp.read()
+        return cls._check_response(resp)
 
+    @classmethod
+    async def _acheck_stream(cls, resp: httpx.Response) -> httpx.Response:
+        if resp.status_code >= 400:
+            await resp.aread()
+        return cls._check_response(resp)
+
+    @staticmethod
+    def _check_response(resp: httpx.Response) -> httpx.Response:
         if resp.status_code >= 400:
             try:
-                error = resp.json()
-            except:
-                error = {"message": resp.text}
+                error = from_json(resp.content)
+            except ValueError:
+                # Only decode the head of a non-JSON body, which may be large or binary
+                error = {"message": resp.content[:MAX_ERROR_BODY].decode("utf-8", "replace")}
             raise Exception(f"API error {resp.status_code}: {error}")
 
         return resp
 
+
 def process_url_async(client: DoclingServeClient,
-        url_path, selected_option) -> TaskStatusResponse:
-    """POST /v1/convert/source/async"""
+        url_path, selected_option="md") -> TaskStatusResponse:
+    """POST /v1/convert/source/async
+
+    Only submits the conversion: the returned status carries the task_id, so
+    many URLs can be enqueued before collecting them with gather_results.
+    """
     request = {
-        "url": url_path,
-        "model": "docling-minilm-legacy",  # arXiv PDFs often need this
-        "pages": "all"
+        "options": {"to_formats": [selected_option]},
+        "sources": [{"kind": "http", "url": url_path}],
     }
-    resp = client.request(method, url_path, **kwargs) # self._request("POST", PROCESS_URL_ENDPOINT, json=request)
-    return TaskStatusResponse.model_validate(resp.json())
+    resp = client._request("POST", PROCESS_URL_ENDPOINT, json=request)
+    return TaskStatusResponse.model_validate_json(resp.content)
+
+
+def _run_with_async_client(
+        client: DoclingServeClient,
+        make_coro: Callable[[httpx.AsyncClient], Awaitable[T]]
+) -> T:
+    """Run a coroutine on a fresh event loop with an AsyncClient opened on it.
+
+    The AsyncClient lives and dies with the loop, so the sync batch helpers can
+    be called any number of times on the same DoclingServeClient.
+    """
+    async def _run() -> T:
+        async with client.async_client() as aclient:
+            return await make_coro(aclient)
+
+    return asyncio.run(_run())
+
+
+def gather_results(client: DoclingServeClient, task_ids: List[str]) -> List[Dict[str, Any]]:
+    """Long-poll the submitted tasks concurrently and return their results in order."""
+    async def _gather(aclient: httpx.AsyncClient) -> List[Dict[str, Any]]:
+        return await asyncio.gather(*[client.aget_task_result(aclient, task_id) for task_id in task_ids])
+
+    return _run_with_async_client(client, _gather)
+
+
+def _extract_markdown(data: Any) -> Optional[str]:
+    """Return the markdown of a conversion result, if it has one."""
+    # Document to be processed, could be markdown, Json, html, text
+    document = data.get("document") if isinstance(data, dict) else None
+    if not isinstance(document, dict):
+        return None
+    # md_content is Optional on the server, so an explicit null means no markdown
+    md = document.get("md_content")
+    return str(md) if md is not None else None
+
 
 def process_pdf(
         client: DoclingServeClient,
@@ -158,19 +522,90 @@ def process_pdf(
 
     try:
         resp = client.process_file_async([pdf_path], options)
+        return _extract_markdown(resp)
 
-        # Extract markdown (multiple possible structures)
-        def extract_markdown(data: Any) -> Optional[str]:
-            if isinstance(data, dict):
-                # Document to be processed, could be markdown, Json, html, text
-                if "md_content" in data["document"]:
-                    return str(data.get("document").get("md_content"))
-            return None
+    except Exception as e:
+        raise RuntimeError(f"PDF conversion failed: {e}")
 
 
+async def aprocess_pdf(
+        client: DoclingServeClient,
+        aclient: httpx.AsyncClient,
+        pdf_path, selected_option
+) -> Optional[str]:
+    """Async variant of process_pdf"""
+    if not await asyncio.to_thread(os.path.exists, pdf_path):
+        raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+
+    options = {"output_format": selected_option}
 
-        markdown = extract_markdown(resp)
-        return markdown
+    try:
+        resp = await client.aprocess_file_async(aclient, [pdf_path], options)
+    except Exception as e:
+        raise RuntimeError(f"PDF conversion failed: {e}")
+
+    return _extract_markdown(resp)
+
+
+def process_pdfs_concurrently(
+        client: DoclingServeClient,
+        pdf_paths: List[Path | str], selected_option
+) -> List[Optional[str]]:
+    """Convert several PDFs concurrently, returning their markdown in input order.
+
+    The uploads and polls overlap, so the wall-clock time is bounded by the
+    server's parallelism rather than the sum of the individual conversions.
+    """
+    async def _gather(aclient: httpx.AsyncClient) -> List[Optional[str]]:
+        return await asyncio.gather(
+            *[aprocess_pdf(client, aclient, pdf_path, selected_option) for pdf_path in pdf_paths]
+        )
+
+    return _run_with_async_client(client, _gather)
+
+
+def process_pdfs(
+        client: DoclingServeClient,
+        pdf_paths: List[Path | str], selected_option
+) -> Dict[str, Optional[str]]:
+    """Convert several PDFs as one task, returning their markdown keyed by file name.
+
+    All files share a single upload and a single polling cycle. The server
+    answers a one-document task with JSON and a multi-document one with a zip
+    archive holding a `<stem>.md` per input. Raises ValueError when two inputs
+    share a file stem.
+    """
+    options = {"output_format": selected_option}
+    names = [Path(pdf_path).name for pdf_path in pdf_paths]
+    # Results are keyed by name and matched to zip members by stem, so inputs
+    # sharing either would silently overwrite each other.
+    stems = [Path(name).stem for name in names]
+    if len(set(stems)) != len(stems):
+        raise ValueError(f"PDF file names must have distinct stems: {names}")
+
+    try:
+        task_id = client.submit_files(pdf_paths, options)
+        task = client._wait_for_completion(task_id)
+        if task.task_status != "success":
+            raise Exception(f"Task {task_id} failed")
+        if task.result is not None:
+            return {names[0]: _extract_markdown(task.result)}
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            result_path = client.download_result(task_id, Path(tmp_dir) / "result")
+            if not zipfile.is_zipfile(result_path):
+                return {names[0]: _extract_markdown(from_json(result_path.read_bytes()))}
+
+            with zipfile.ZipFile(result_path) as archive:
+                members = {
+                    Path(member).stem: member
+                    for member in archive.namelist()
+                    if member.endswith(".md")
+                }
+                return {
+                    name: archive.read(members[stem]).decode() if stem in members else None
+                    for name, stem in zip(names, stems)
+                }
 
     except Exception as e:
         raise RuntimeError(f"PDF conversion failed: {e}")
@@ -199,7 +634,8 @@ if __name__ == "__main__":
         else:
             print("❌ No markdown found in response")
         #
-        markdown_url = process_url_async(client, "https://arxiv.org/pdf/2501.17887" )
+        task_url = process_url_async(client, "https://arxiv.org/pdf/2501.17887")
+        markdown_url = _extract_markdown(gather_results(client, [task_url.task_id])[0])
 
         if markdown_url:
             print("✅ Markdown from file extracted successfully!")
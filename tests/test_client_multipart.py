@@ -0,0 +1,60 @@
+import importlib.util
+from pathlib import Path
+
+import httpx
+import pytest
+
+_CLIENT_PATH = (
+    Path(__file__).parent.parent / "examples" / "client" / "docling_serve_client.py"
+)
+
+
+@pytest.fixture(scope="module")
+def client_module():
+    spec = importlib.util.spec_from_file_location("docling_serve_client", _CLIENT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.parametrize(
+    "filename",
+    ["2206.01062v1.pdf", 'quo"te\\back.pdf', "inject\r\nX-Evil: 1.pdf"],
+)
+def test_multipart_upload_matches_httpx(client_module, tmp_path, filename):
+    pdf_path = Path(__file__).parent / "2206.01062v1.pdf"
+    data = {"options": '{"to_formats": ["md"]}'}
+
+    with open(pdf_path, "rb") as file_handle:
+        upload = client_module.MultipartUpload(
+            [(filename, file_handle, "application/pdf")], data, chunk_size=4096
+        )
+        content_length = upload.content_length
+        body = b"".join(upload)
+
+    with open(pdf_path, "rb") as file_handle:
+        expected = httpx.Request(
+            "POST",
+            "http://localhost/v1/convert/file/async",
+            headers={"Content-Type": upload.content_type},
+            data=data,
+            files=[("files", (filename, file_handle, "application/pdf"))],
+        ).read()
+
+    assert body == expected
+    assert len(body) == content_length
+    assert b"\r\nX-Evil" not in body
+
+
+async def test_multipart_upload_async_body(client_module):
+    pdf_path = Path(__file__).parent / "2206.01062v1.pdf"
+
+    with open(pdf_path, "rb") as file_handle:
+        upload = client_module.MultipartUpload(
+            [(pdf_path.name, file_handle, "application/pdf")], {}, chunk_size=4096
+        )
+        content_length = upload.content_length
+        body = b"".join([chunk async for chunk in upload.aiter_bytes()])
+
+    assert len(body) == content_length
+    assert body.endswith(f"--{upload.boundary}--\r\n".encode())